@@ -1,17 +1,48 @@
 import pandas as pd
-import matplotlib.pyplot as plt
-import matplotlib.dates as mdates
+import numpy as np
 import os
 import argparse
-import urllib.request
-import ssl
-import zipfile
 import shutil
+import functools
 import warnings
 import re
+import json
 from pathlib import Path
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from datetime import datetime
 
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = pq = None  # Parquet cache is disabled without pyarrow
+
+try:
+    import python_calamine  # noqa: F401
+    # Rust based reader, much faster than openpyxl, supported by pandas from version 2.2
+    pandas_version = tuple(int(part) for part in re.findall(r'\d+', pd.__version__)[:2])
+    EXCEL_ENGINE = 'calamine' if pandas_version >= (2, 2) else None  # Older pandas use openpyxl or xlrd
+except ImportError:
+    EXCEL_ENGINE = None  # Let pandas pick openpyxl or xlrd
+
+def _extract_member(zip_ref, member, data_path):
+    """
+    Extract a single zip member directly into data_path, flattening the folder structure.
+    
+    Parameters:
+    zip_ref (zipfile.ZipFile): Opened zip archive
+    member (str): Name of the member to extract
+    data_path (Path): Folder to extract the file into
+    """
+    # Get just the filename without the directory path
+    filename = os.path.basename(member)
+    if filename:  # Skip if it's a directory
+        # Extract to data_path directly, streaming in 1 MiB chunks
+        target_path = data_path / filename
+        with zip_ref.open(member) as source, open(target_path, 'wb') as target:
+            shutil.copyfileobj(source, target, length=1024 * 1024)
+
+
 def ensure_data_folder(data_folder='data', force_refresh=False):
     """
     Ensure data folder exists with Excel files. If not, download and extract from gouv.fr.
@@ -27,7 +58,7 @@ def ensure_data_folder(data_folder='data', force_refresh=False):
     
     # Check if data folder exists and has Excel files
     if data_path.exists() and not force_refresh:
-        excel_files = list(data_path.glob('*.xlsx')) + list(data_path.glob('*.xls'))
+        excel_files = _find_excel_files(data_path, '')
         if excel_files:
             print(f"Found {len(excel_files)} Excel file(s) in '{data_folder}' folder.")
             # If data folder have been created more than 6 months ago, suggest refreshing
@@ -36,10 +67,6 @@ def ensure_data_folder(data_folder='data', force_refresh=False):
                 print(f"Note: The data folder is {folder_age} days old. Consider refreshing the data with --refresh option.")
             return True
     
-    # Need to download data
-    print("Downloading pollen data from data.gouv.fr...")
-    print("This may take a minute...")
-    
     # Create data folder if it doesn't exist
     data_path.mkdir(parents=True, exist_ok=True)
     
@@ -48,42 +75,76 @@ def ensure_data_folder(data_folder='data', force_refresh=False):
     zip_url = "https://www.data.gouv.fr/api/1/datasets/r/d8c275e4-9e8b-4c58-97fe-8f0d48d2d5c7"
     
     zip_file = data_path / 'pollen_data.zip'
+    # Sidecar file storing the ETag (or Last-Modified date) of the downloaded archive
+    etag_file = data_path / '.etag'
     
     try:
-        # Create SSL context that bypasses certificate verification
-        # (needed for some systems with certificate issues)
-        ssl_context = ssl.create_default_context()
-        ssl_context.check_hostname = False
-        ssl_context.verify_mode = ssl.CERT_NONE
+        # Only needed when downloading, imported here to keep the module import fast
+        import zipfile
+        import certifi
+        import urllib3
+        
+        # Verify certificates with the certifi bundle, which also works on systems with missing or
+        # outdated certificates, and share one pool so the version check and download reuse the connection
+        http = urllib3.PoolManager(cert_reqs='CERT_REQUIRED', ca_certs=certifi.where())
+        
+        # Ask the server for the archive version and skip the download if it did not change
+        remote_version = None
+        try:
+            response = http.request('HEAD', zip_url)
+            if response.status == 200:
+                remote_version = response.headers.get('ETag') or response.headers.get('Last-Modified')
+        except Exception as e:
+            print(f"Warning: Could not check the data version: {e}")
+        
+        excel_files = _find_excel_files(data_path, '')
+        if remote_version and excel_files and etag_file.exists() and etag_file.read_text() == remote_version:
+            # Mark the data as fresh so that the age note is not shown
+            os.utime(data_path)
+            print(f"Data in '{data_folder}' folder is already up to date.")
+            return True
+        
+        # Need to download data
+        print("Downloading pollen data from data.gouv.fr...")
+        print("This may take a minute...")
         
         # Download the zip file
         print(f"Downloading from: {zip_url}")
-        with urllib.request.urlopen(zip_url, context=ssl_context) as response:
+        response = http.request('GET', zip_url, preload_content=False)
+        try:
+            if response.status != 200:
+                raise urllib3.exceptions.HTTPError(f"HTTP error {response.status}")
             with open(zip_file, 'wb') as out_file:
-                out_file.write(response.read())
+                # Stream the response to disk in 1 MiB chunks instead of buffering it in memory
+                shutil.copyfileobj(response, out_file, length=1024 * 1024)
+        finally:
+            response.release_conn()
         print(f"Downloaded to: {zip_file}")
         
         # Extract the zip file
         print(f"Extracting files from zip...")
         with zipfile.ZipFile(zip_file, 'r') as zip_ref:
-            # Extract all files, flattening the folder structure
-            for member in zip_ref.namelist():
-                # Get just the filename without the directory path
-                filename = os.path.basename(member)
-                if filename:  # Skip if it's a directory
-                    # Extract to data_path directly
-                    source = zip_ref.open(member)
-                    target_path = data_path / filename
-                    with open(target_path, 'wb') as target:
-                        target.write(source.read())
-                    source.close()
+            # Folders are flattened, so keep only the last member for each file name (as a serial
+            # extraction would) and never let two threads write the same target file
+            members = {os.path.basename(member): member for member in zip_ref.namelist()}
+            
+            # Extract all files in parallel so that decompression overlaps with disk writes
+            with ThreadPoolExecutor(max_workers=4) as executor:
+                list(executor.map(lambda member: _extract_member(zip_ref, member, data_path), members.values()))
         
         # Remove the zip file
         zip_file.unlink()
         print(f"Data extracted successfully to '{data_folder}' folder.")
         
+        # Remember the downloaded version for the next refresh
+        if remote_version:
+            etag_file.write_text(remote_version)
+        else:
+            # The version of the new data is unknown, a stale one must not skip the next download
+            etag_file.unlink(missing_ok=True)
+        
         # Verify we have Excel files
-        excel_files = list(data_path.glob('*.xlsx')) + list(data_path.glob('*.xls'))
+        excel_files = _find_excel_files(data_path, '')
         if excel_files:
             print(f"Found {len(excel_files)} Excel file(s) in '{data_folder}' folder.")
             return True
@@ -98,6 +159,383 @@ def ensure_data_folder(data_folder='data', force_refresh=False):
         return False
 
 
+def _find_excel_files(folder_path, city_name):
+    """
+    Find Excel files whose name contains the city name (case-insensitive).
+    
+    Parameters:
+    folder_path (str): Path to the folder containing Excel files
+    city_name (str): City name to search for in filenames (an empty name matches every Excel file)
+    
+    Returns:
+    list: Paths of the matching .xlsx and .xls files
+    """
+    # Single directory scan instead of one glob per extension
+    city_pattern = re.compile(re.escape(city_name), re.IGNORECASE)
+    with os.scandir(folder_path) as entries:
+        return [Path(entry.path) for entry in entries
+                if entry.name.lower().endswith(('.xlsx', '.xls')) and city_pattern.search(entry.name) and entry.is_file()]
+
+
+def _read_excel(excel_file, **kwargs):
+    """
+    Read the first sheet of an Excel file with pandas, using the calamine engine when installed.
+    
+    Parameters:
+    excel_file (Path): Path to the Excel file
+    **kwargs: Extra arguments passed to pd.read_excel
+    
+    Returns:
+    pd.DataFrame: Content of the first sheet
+    """
+    # Read Excel file and suppress specific warnings from openpyxl about stylesheets
+    with warnings.catch_warnings():
+        warnings.filterwarnings("ignore", category=UserWarning, module=re.escape('openpyxl.styles.stylesheet'))
+        return pd.read_excel(excel_file, sheet_name=0, engine=EXCEL_ENGINE, **kwargs)
+
+
+def _get_cache_file(excel_file):
+    """
+    Return the path of the Parquet cache of an Excel file.
+    """
+    # Key on the full file name so that X.xls and X.xlsx do not share a cache file
+    return excel_file.parent / '.cache' / (excel_file.name + '.parquet')
+
+
+def _is_cache_fresh(excel_file):
+    """
+    Check if the Parquet cache of an Excel file can be used instead of the Excel file.
+    """
+    cache_file = _get_cache_file(excel_file)
+    # Use the cached copy if it is at least as recent as the Excel file
+    return pq is not None and cache_file.exists() and cache_file.stat().st_mtime >= excel_file.stat().st_mtime
+
+
+def read_excel_header(excel_file):
+    """
+    Read only the column names of an Excel file.
+    
+    Parameters:
+    excel_file (Path): Path to the Excel file
+    
+    Returns:
+    list: Column names of the first sheet
+    """
+    cache_file = _get_cache_file(excel_file)
+    if _is_cache_fresh(excel_file):
+        try:
+            return pq.read_schema(cache_file).names
+        except Exception as e:
+            print(f"Warning: Could not read cache for {excel_file.name}: {e}")
+    
+    return list(_read_excel(excel_file, nrows=0).columns)
+
+
+def read_excel_cached(excel_file, usecols=None):
+    """
+    Read an Excel file, using a Parquet cache stored next to it when available.
+    
+    The cache lives in a '.cache' folder beside the Excel file and is rebuilt
+    whenever the Excel file is newer than its cached copy. The whole sheet is
+    cached so that any column can later be loaded from it.
+    
+    Parameters:
+    excel_file (Path): Path to the Excel file
+    usecols (list): Column indexes (0-based) to load. If None, all columns are loaded
+    
+    Returns:
+    pd.DataFrame: Content of the first sheet
+    """
+    cache_file = _get_cache_file(excel_file)
+    if _is_cache_fresh(excel_file):
+        try:
+            if usecols is None:
+                return pd.read_parquet(cache_file)
+            # Parquet columns are selected by name, Excel headers may not be unique strings so positions are kept in the API
+            names = pq.read_schema(cache_file).names
+            return pd.read_parquet(cache_file, columns=[names[index] for index in usecols])
+        except Exception as e:
+            print(f"Warning: Could not read cache for {excel_file.name}: {e}")
+    
+    # Without Parquet support, only parse the requested columns
+    if pq is None:
+        return _read_excel(excel_file, usecols=usecols)
+    
+    df = _read_excel(excel_file)
+    
+    # Parquet needs string column names and one type per column, cells like "ND" become NaN
+    df.columns = [str(column) for column in df.columns]
+    df[df.columns[0]] = pd.to_datetime(df[df.columns[0]], errors='coerce', cache=True)
+    for column in df.columns[1:]:
+        df[column] = pd.to_numeric(df[column], errors='coerce')
+    
+    # Save the parsed frame so that next runs skip the Excel parsing
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        df.to_parquet(cache_file, compression='zstd')
+    except Exception as e:
+        print(f"Warning: Could not cache {excel_file.name}: {e}")
+    
+    return df.iloc[:, usecols] if usecols is not None else df
+
+
+def _read_xlsx_columns(excel_file, col_index):
+    """
+    Stream the date column and one allergen column of an .xlsx file with openpyxl.
+    
+    Rows are read as plain value tuples in read-only mode and stored in preallocated
+    arrays, skipping the DataFrame construction done by pd.read_excel. Dates are
+    converted at the end, per file, since files may use different date formats.
+    
+    Parameters:
+    excel_file (Path): Path to the .xlsx file
+    col_index (int): Index (0-based) of the allergen column
+    
+    Returns:
+    tuple: Arrays of dates and float32 allergen values
+    """
+    # Only needed without Parquet cache nor calamine, imported here to keep the module import fast
+    import openpyxl
+    
+    with warnings.catch_warnings():
+        warnings.filterwarnings("ignore", category=UserWarning, module=re.escape('openpyxl.styles.stylesheet'))
+        workbook = openpyxl.load_workbook(excel_file, read_only=True, data_only=True)
+    
+    try:
+        sheet = workbook.worksheets[0]
+        # The sheet dimension gives the row count, the arrays grow if it is missing or wrong
+        size = max((sheet.max_row or 1) - 1, 1)
+        dates = np.empty(size, dtype=object)
+        values = np.full(size, np.nan, dtype='float32')
+        
+        count = 0
+        for row in sheet.iter_rows(min_row=2, max_col=col_index + 1, values_only=True):
+            if count == len(values):
+                dates = np.concatenate([dates, np.empty(count, dtype=object)])
+                values = np.concatenate([values, np.full(count, np.nan, dtype='float32')])
+            
+            dates[count] = row[0]
+            try:
+                values[count] = row[col_index]
+            except (TypeError, ValueError):
+                pass  # Empty or non-numeric cell, keep NaN
+            count += 1
+        
+        # Convert date column to datetime if needed, repeated values are parsed once
+        dates = pd.to_datetime(dates[:count], errors='coerce', cache=True).to_numpy()
+        return dates, values[:count]
+    finally:
+        workbook.close()
+
+
+def _resolve_column_index(columns, allergen_col, file_name):
+    """
+    Find the index of the allergen column in a list of column names.
+    
+    Parameters:
+    columns (list): Column names of the file
+    allergen_col (int or str): Column index (0-based) or name for the allergen
+    file_name (str): Name of the file, used in warnings
+    
+    Returns:
+    int: Index of the allergen column, or None if it does not exist
+    """
+    # Convert allergen_col to integer if it's a column name
+    if isinstance(allergen_col, str):
+        if allergen_col in columns:
+            return columns.index(allergen_col)
+        print(f"Warning: Column '{allergen_col}' not found in {file_name}. Skipping.")
+        return None
+    
+    # Check if columns exist
+    if len(columns) > max(0, allergen_col):
+        return allergen_col
+    print(f"Warning: Column index {allergen_col} does not exist in {file_name}. Skipping.")
+    return None
+
+
+def _parse_excel_file(excel_file, allergen_col):
+    """
+    Extract allergen data and date from a single Excel file.
+    
+    Parameters:
+    excel_file (Path): Path to the Excel file
+    allergen_col (int or str): Column index (0-based) or name for the allergen
+    
+    Returns:
+    tuple: Column names of the file and a tuple of dates and float32 allergen values
+           arrays (None if the allergen column does not exist), or None if the file cannot be read
+    """
+    print(f"Processing: {excel_file.name}")
+    try:
+        # Read the header first to only load the needed columns
+        columns = read_excel_header(excel_file)
+        col_index = _resolve_column_index(columns, allergen_col, excel_file.name)
+        
+        if col_index is not None:
+            # Without cache nor calamine, stream the two columns straight from the workbook
+            if pq is None and EXCEL_ENGINE is None and excel_file.suffix.lower() == '.xlsx':
+                return columns, _read_xlsx_columns(excel_file, col_index)
+            
+            # Select columns A and allergen by position, headers are not always strings
+            df = read_excel_cached(excel_file, usecols=[0, col_index])
+            
+            # Store allergen values as float32, which is precise enough for pollen counts and halves memory
+            values = pd.to_numeric(df.iloc[:, -1], errors='coerce').to_numpy(dtype='float32')
+            
+            # Convert date column to datetime if needed, per file since files may use different date formats
+            dates = pd.to_datetime(df.iloc[:, 0], errors='coerce', cache=True).to_numpy()
+            
+            return columns, (dates, values)
+        else:
+            return columns, None
+    
+    except Exception as e:
+        print(f"Error reading {excel_file.name}: {e}")
+        return None
+
+
+def _load_master_frame(excel_file):
+    """
+    Load an Excel file in the layout of the master cache.
+    
+    Parameters:
+    excel_file (Path): Path to the Excel file
+    
+    Returns:
+    pd.DataFrame: DataFrame with columns 'source', 'date' and one float32 column per allergen, or None on error
+    """
+    print(f"Processing: {excel_file.name}")
+    try:
+        df = read_excel_cached(excel_file)
+        # Parquet needs string column names, the first column always holds the dates
+        df.columns = ['date'] + [str(column) for column in df.columns[1:]]
+        df['date'] = pd.to_datetime(df['date'], errors='coerce', cache=True)
+        for column in df.columns[1:]:
+            df[column] = pd.to_numeric(df[column], errors='coerce').astype('float32')
+        df.insert(0, 'source', excel_file.name)
+        return df
+    except Exception as e:
+        print(f"Error reading {excel_file.name}: {e}")
+        return None
+
+
+def _get_master_columns(master_file):
+    """
+    Return the columns of each source file stored in the master cache, keyed by file name.
+    """
+    return json.loads(pq.read_schema(master_file).metadata[b'pollen_plot.columns'])
+
+
+def build_master_cache(data_folder='data'):
+    """
+    Ingest every Excel file of the data folder into a single Parquet file.
+    
+    Each Excel file becomes one row group tagged with its file name in the
+    'source' column, so that the files of a city can be read back with a
+    filter instead of parsing the workbooks again. The master cache is
+    rebuilt when Excel files are added, removed or modified.
+    
+    Parameters:
+    data_folder (str): Path to the folder containing Excel files (default: 'data')
+    
+    Returns:
+    Path: Path to the master cache, or None if it is not available
+    """
+    if pq is None:
+        return None
+    
+    excel_files = _find_excel_files(data_folder, '')
+    if not excel_files:
+        return None
+    
+    master_file = Path(data_folder) / '.cache' / 'master.parquet'
+    
+    # Reuse the master cache if it holds the same files and none of them changed since
+    if master_file.exists():
+        try:
+            master_mtime = master_file.stat().st_mtime
+            if (set(_get_master_columns(master_file)) == {excel_file.name for excel_file in excel_files}
+                    and all(excel_file.stat().st_mtime <= master_mtime for excel_file in excel_files)):
+                return master_file
+        except Exception as e:
+            print(f"Warning: Could not read master cache: {e}")
+    
+    # Without a writable cache folder the workbooks would be parsed here for nothing, then again per city
+    try:
+        master_file.parent.mkdir(parents=True, exist_ok=True)
+    except OSError as e:
+        print(f"Warning: Could not build master cache: {e}")
+        return None
+    if not os.access(master_file.parent, os.W_OK):
+        print(f"Warning: Could not build master cache: '{master_file.parent}' is not writable")
+        return None
+    
+    print(f"Building master cache from {len(excel_files)} Excel file(s)...")
+    
+    # Workbooks are independent, so parse them in parallel on all cores
+    with ProcessPoolExecutor(max_workers=min(len(excel_files), os.cpu_count() or 1)) as executor:
+        results = list(executor.map(_load_master_frame, excel_files))
+    
+    frames = [df for df in results if df is not None]
+    if not frames:
+        return None
+    
+    # Unreadable files are recorded without columns so they do not trigger a rebuild on every run
+    columns = {excel_file.name: list(df.columns[1:]) if df is not None else None
+               for excel_file, df in zip(excel_files, results)}
+    
+    # Use the union of all allergen columns, files missing a column get NaN values
+    allergens = list(dict.fromkeys(column for df in frames for column in df.columns[2:]))
+    schema = pa.schema(
+        [('source', pa.string()), ('date', pa.timestamp('us'))] + [(allergen, pa.float32()) for allergen in allergens],
+        metadata={'pollen_plot.columns': json.dumps(columns)}
+    )
+    
+    try:
+        with pq.ParquetWriter(master_file, schema, compression='zstd') as writer:
+            for df in frames:
+                df = df.reindex(columns=schema.names)
+                writer.write_table(pa.Table.from_pandas(df, schema=schema, preserve_index=False))
+    except Exception as e:
+        print(f"Warning: Could not build master cache: {e}")
+        master_file.unlink(missing_ok=True)
+        return None
+    
+    return master_file
+
+
+def _read_master_cache(master_file, excel_files, allergen_col):
+    """
+    Read allergen data and date of the given Excel files from the master cache.
+    
+    Parameters:
+    master_file (Path): Path to the master cache
+    excel_files (list): Excel files to read
+    allergen_col (int or str): Column index (0-based) or name for the allergen
+    
+    Returns:
+    list: Tuples of date and float32 allergen value arrays
+    """
+    master_columns = _get_master_columns(master_file)
+    
+    # Group files by the master column holding the allergen, as its position can differ between files
+    sources_by_column = {}
+    for excel_file in excel_files:
+        columns = master_columns[excel_file.name]
+        if columns is None:
+            continue  # The file could not be read when building the master cache
+        col_index = _resolve_column_index(columns, allergen_col, excel_file.name)
+        if col_index is not None:
+            sources_by_column.setdefault(columns[col_index], []).append(excel_file.name)
+    
+    data = []
+    for column, sources in sources_by_column.items():
+        df = pd.read_parquet(master_file, columns=['date', column], filters=[('source', 'in', sources)])
+        data.append((df['date'].to_numpy(), df[column].to_numpy(dtype='float32')))
+    return data
+
+
 def extract_alnus_data(folder_path, city_name='NICE', allergen_col=None):
     """
     Extract allergen data and date from all Excel files in a folder.
@@ -108,15 +546,16 @@ def extract_alnus_data(folder_path, city_name='NICE', allergen_col=None):
     allergen_col (int or str): Column index (0-based) or name for the allergen. If None, defaults to column 6 (G)
     
     Returns:
-    pd.DataFrame: DataFrame with columns 'date', 'year', and 'allergen'
+    pd.DataFrame: DataFrame with columns 'date' and 'allergen'. The allergen columns found in the
+                  files are listed in its attrs['available_columns'], so callers do not need to read
+                  the files again with get_available_columns
     """
     # keep first 8 charactes of the city_name to avoid issues with long city names
     city_name = city_name[:8]
     if allergen_col is None:
         allergen_col = 6  # Default to column G (index 6)
     
-    data = []
-    excel_files = list(Path(folder_path).glob(f'*{city_name}*.xlsx')) + list(Path(folder_path).glob(f'*{city_name}*.xls'))
+    excel_files = _find_excel_files(folder_path, city_name)
     
     if not excel_files:
         print(f"No Excel files found in {folder_path} for city '{city_name}'")
@@ -124,51 +563,33 @@ def extract_alnus_data(folder_path, city_name='NICE', allergen_col=None):
     
     print(f"Found {len(excel_files)} Excel file(s)")
     
-    for excel_file in excel_files:
-        print(f"Processing: {excel_file.name}")
-        try:
-            # Read Excel file and suppress specific warnings from openpyxl about stylesheets
-            with warnings.catch_warnings():
-                warnings.filterwarnings("ignore", category=UserWarning, module=re.escape('openpyxl.styles.stylesheet'))
-                df = pd.read_excel(excel_file)
-            
-            # Convert allergen_col to integer if it's a column name
-            if isinstance(allergen_col, str):
-                if allergen_col in df.columns:
-                    col_index = df.columns.get_loc(allergen_col)
-                else:
-                    print(f"Warning: Column '{allergen_col}' not found in {excel_file.name}. Skipping.")
-                    continue
-            else:
-                col_index = allergen_col
-            
-            # Check if columns exist
-            if len(df.columns) > max(0, col_index):
-                df_subset = df.iloc[:, [0, col_index]].copy()  # Select columns A and allergen
-                allergen_name = df.columns[col_index] if isinstance(df.columns[col_index], str) else f'Column {chr(65 + col_index)}'
-                df_subset.columns = ['date', 'allergen']
-                
-                # Convert date column to datetime if needed
-                df_subset['date'] = pd.to_datetime(df_subset['date'], errors='coerce')
-                
-                # Extract year from date
-                df_subset['year'] = df_subset['date'].dt.year
-                
-                # Remove rows with missing values
-                df_subset = df_subset.dropna()
-                
-                data.append(df_subset)
-            else:
-                print(f"Warning: Column index {col_index} does not exist in {excel_file.name}. Skipping.")
-        
-        except Exception as e:
-            print(f"Error reading {excel_file.name}: {e}")
+    # Read from the master cache of all files when available
+    master_file = build_master_cache(folder_path)
+    if master_file is not None:
+        data = _read_master_cache(master_file, excel_files, allergen_col)
+        available_columns = _get_master_columns(master_file)[excel_files[0].name] or []
+    else:
+        # Workbooks are independent, so parse them in parallel on all cores
+        with ProcessPoolExecutor(max_workers=min(len(excel_files), os.cpu_count() or 1)) as executor:
+            results = [result for result in executor.map(functools.partial(_parse_excel_file, allergen_col=allergen_col), excel_files)
+                       if result is not None]
+        data = [arrays for _, arrays in results if arrays is not None]
+        available_columns = results[0][0] if results else []
     
     if data:
-        combined_df = pd.concat(data, ignore_index=True)
-        return combined_df
+        # Build the DataFrame once from the concatenated arrays
+        combined_df = pd.DataFrame({
+            'date': np.concatenate([dates for dates, _ in data]),
+            'allergen': np.concatenate([values for _, values in data])
+        })
+        
+        # Remove rows with missing values
+        combined_df = combined_df.dropna().reset_index(drop=True)
     else:
-        return pd.DataFrame()
+        combined_df = pd.DataFrame()
+    
+    combined_df.attrs['available_columns'] = available_columns[1:]  # All columns except the first (date)
+    return combined_df
 
 
 def get_available_columns(folder_path, city_name='NICE'):
@@ -184,76 +605,72 @@ def get_available_columns(folder_path, city_name='NICE'):
     """
     # keep first 8 charactes of the city_name to avoid issues with long city names
     city_name = city_name[:8]
-    excel_files = list(Path(folder_path).glob(f'*{city_name}*.xlsx')) + list(Path(folder_path).glob(f'*{city_name}*.xls'))
+    excel_files = _find_excel_files(folder_path, city_name)
     
     if excel_files:
         try:
-            df = pd.read_excel(excel_files[0])
-            return list(df.columns[1:])  # Return all columns except the first (date)
+            columns = read_excel_header(excel_files[0])
+            return columns[1:]  # Return all columns except the first (date)
         except Exception as e:
             print(f"Error reading {excel_files[0]}: {e}")
     
     return []
 
 
-def plot_allergen_by_week(df, allergen_name='ALNUS', num_years=10, city_name='NICE', output_file='allergen_plot.png'):
+def plot_allergen_by_week(df, allergen_name='ALNUS', num_years=10, city_name='NICE', output_file='allergen_plot.png', dpi=150):
     """
-    Create a scatter plot with week on x-axis and allergen values on y-axis.
+    Create a line plot with markers, with week on x-axis and allergen values on y-axis.
     
     Parameters:
-    df (pd.DataFrame): DataFrame with columns 'date', 'year', and 'allergen'
+    df (pd.DataFrame): DataFrame with columns 'date' and 'allergen'
     allergen_name (str): Name of the allergen to display in the title
     num_years (int): Number of years to plot (default: 10)
     city_name (str): Name of the city (default: 'NICE')
     output_file (str): Path to save the plot image
+    dpi (int): Resolution of the saved image (default: 150)
     """
-    
     if df.empty:
         print("No data to plot")
         return
     
-    # Filter to last N years
-    max_year = df['year'].max()
-    min_year = max_year - (num_years - 1)
-    df_filtered = df[df['year'] >= min_year].copy()
+    # Import matplotlib only when plotting, it is slow to load
+    import matplotlib.pyplot as plt
+    import matplotlib.dates as mdates
     
-    plt.figure(figsize=(14, 7))
+    # Filter to last N years first, so that only the remaining rows are sorted
+    max_year = df['date'].max().year
+    min_year = max_year - (num_years - 1)
+    df_filtered = df[df['date'] >= pd.Timestamp(year=min_year, month=1, day=1)]
     
     # Sort by date for better visualization
-    df_sorted = df_filtered.sort_values('date').copy()
+    allergen_by_date = df_filtered.set_index('date')['allergen'].sort_index()
     
-    # Group by year and week
-    df_sorted['year_week'] = df_sorted['date'].dt.to_period('W')
+    fig, ax = plt.subplots(figsize=(14, 7))
     
-    # Calculate mean allergen value per week
-    weekly_mean = df_sorted.groupby('year_week')['allergen'].mean()
+    # Calculate mean allergen value per week (weeks start on Monday and are labelled by it)
+    weekly_mean = allergen_by_date.resample('W-MON', label='left', closed='left').mean().dropna()
+    week_labels = weekly_mean.index
     
-    # Convert period index to timestamp for better plotting
-    week_labels = weekly_mean.index.to_timestamp()
-    
-    # Plot
-    plt.scatter(week_labels, weekly_mean.values, s=100, alpha=0.6, color='blue', label=f'Mean {allergen_name}')
-    
-    # Optional: Add a line plot for better visualization
-    plt.plot(week_labels, weekly_mean.values, alpha=0.3, color='blue')
+    # Plot points and line as a single artist (transparent line, more opaque markers)
+    ax.plot(week_labels, weekly_mean.values, color=(0, 0, 1, 0.3), marker='o', markersize=10,
+            markerfacecolor=(0, 0, 1, 0.6), markeredgecolor=(0, 0, 1, 0.6), label=f'Mean {allergen_name}')
     
     # Labels and title
-    plt.xlabel('Week', fontsize=12, fontweight='bold')
-    plt.ylabel(f'{allergen_name} Value', fontsize=12, fontweight='bold')
-    plt.title(f'{allergen_name} Values in {city_name} ({min_year}-{max_year})', fontsize=14, fontweight='bold')
-    plt.grid(True, alpha=0.3)
-    plt.legend()
+    ax.set_xlabel('Week', fontsize=12, fontweight='bold')
+    ax.set_ylabel(f'{allergen_name} Value', fontsize=12, fontweight='bold')
+    ax.set_title(f'{allergen_name} Values in {city_name} ({min_year}-{max_year})', fontsize=14, fontweight='bold')
+    ax.grid(True, alpha=0.3)
+    ax.legend()
     
     # Format x-axis to show month - year format
-    ax = plt.gca()
     ax.xaxis.set_major_locator(mdates.MonthLocator())
     ax.xaxis.set_major_formatter(mdates.DateFormatter('%b-%y'))
     
     # Rotate x-axis labels for better readability
-    plt.xticks(rotation=45, ha='right')
+    plt.setp(ax.get_xticklabels(), rotation=45, ha='right')
     
     # Save the plot
-    plt.savefig(output_file, dpi=300, bbox_inches='tight')
+    fig.savefig(output_file, dpi=dpi, bbox_inches='tight')
     print(f"Plot saved to: {output_file}")
     
     # Display the plot
@@ -292,6 +709,12 @@ if __name__ == "__main__":
         action='store_true',
         help='Force download and refresh data from data.gouv.fr'
     )
+    parser.add_argument(
+        '--dpi',
+        type=int,
+        default=150,
+        help='Resolution of the saved plot image (default: 150)'
+    )
     
     args = parser.parse_args()
     
@@ -328,7 +751,7 @@ if __name__ == "__main__":
         if data_df.empty:
             # Get available columns and suggest them
             print("\nTrying to detect available allergens...")
-            available_cols = get_available_columns(folder_path, args.city)
+            available_cols = data_df.attrs.get('available_columns') or get_available_columns(folder_path, args.city)
             if available_cols:
                 print("Available allergen columns:")
                 for idx, col in enumerate(available_cols, start=1):
@@ -338,8 +761,8 @@ if __name__ == "__main__":
             else:
                 print("No columns found.")
         else:
-            min_year = data_df['year'].min()
-            max_year = data_df['year'].max()
+            min_year = data_df['date'].min().year
+            max_year = data_df['date'].max().year
             print("\nExtracted Data Summary:")
             print(data_df.head())
             print(f"\nTotal records: {len(data_df)}")
@@ -347,6 +770,6 @@ if __name__ == "__main__":
             
             # Create plot
             output_file = f'{allergen_name.lower()}_{args.city.lower()}_{min_year}-{max_year}.png'
-            plot_allergen_by_week(data_df, allergen_name, args.years, args.city, output_file)
+            plot_allergen_by_week(data_df, allergen_name, args.years, args.city, output_file, args.dpi)
     else:
         print(f"Invalid folder path: {folder_path}")